@@ -23,7 +23,8 @@ def p_program(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_external_declaration(p):
     '''external_declaration : function
@@ -49,7 +50,8 @@ def p_parameter_list(p):
     if len(p) == 2:
         p[0] = [] if p[1] is None else [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_parameter(p):
     '''parameter : type IDENTIFIER'''
@@ -69,7 +71,8 @@ def p_statements(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[2]]
+        p[1].append(p[2])
+        p[0] = p[1]
 
 def p_statement(p):
     '''statement : declaration SEMICOLON
@@ -162,7 +165,8 @@ def p_argument_list(p):
     if len(p) == 2:
         p[0] = [] if p[1] is None else [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_empty(p):
     '''empty :'''
@@ -174,4 +178,6 @@ def p_error(p):
     else:
         print("Syntax error at EOF")
 
-parser = yacc.yacc()
+# optimize=1 loads the prebuilt tables from parsetab.py instead of checking
+# them against the grammar on import; delete parsetab.py after changing a rule.
+parser = yacc.yacc(optimize=1, write_tables=True)
@@ -1,32 +1,71 @@
+import hashlib
+import json
+from collections import OrderedDict, defaultdict
+
 from pyflowchart import Flowchart, StartNode, OperationNode, ConditionNode, EndNode
 
+# Rendered flowchart DSL, keyed by a digest of the flow graph it came from.
+# Only strings are kept: pyflowchart objects are mutated by every render, so
+# they are never shared between callers. Bounded so a long-running caller
+# does not keep every graph alive.
+_FLOWCHART_CACHE_SIZE = 256
+_flowchart_cache = OrderedDict()
+
+def _flowgraph_key(flowgraph):
+    data = json.dumps(flowgraph, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).digest()
+
+def render_flowchart(flowgraph):
+    """Return the flowchart DSL for flowgraph, reusing an earlier render."""
+    key = _flowgraph_key(flowgraph)
+    content = _flowchart_cache.get(key)
+    if content is not None:
+        _flowchart_cache.move_to_end(key)
+        return content
+
+    content = generate_flowchart(flowgraph).flowchart()
+    _flowchart_cache[key] = content
+    if len(_flowchart_cache) > _FLOWCHART_CACHE_SIZE:
+        _flowchart_cache.popitem(last=False)
+    return content
+
+# Flowchart node factory for each CFG node type; anything else is an operation.
+_NODE_FACTORIES = {
+    'Function': lambda node: StartNode(f"Function {node['name']}"),
+    'If': lambda node: ConditionNode(f"Condition {node['condition']}"),
+    'IfElse': lambda node: ConditionNode(f"Condition {node['condition']}"),
+    'While': lambda node: ConditionNode(f"While {node['condition']}"),
+    'Return': lambda node: EndNode(f"Return {node['id']}"),
+}
+
+def _operation_node(node):
+    return OperationNode(f"Operation {node['id']}")
+
 def generate_flowchart(flowgraph):
     node_map = {}
+    root_id = None
 
     for node in flowgraph['nodes']:
-        if node['type'] == 'Function':
-            node_map[node['id']] = StartNode(f"Function {node['name']}")
-        elif node['type'] in ['If', 'IfElse']:
-            node_map[node['id']] = ConditionNode(f"Condition {node['condition']}")
-        elif node['type'] == 'While':
-            node_map[node['id']] = ConditionNode(f"While {node['name']}")
-        elif node['type'] == 'Return':
-            node_map[node['id']] = EndNode(f"Return {node['id']}")
-        else:
-            node_map[node['id']] = OperationNode(f"Operation {node['id']}")
+        node_type = node['type']
+        node_map[node['id']] = _NODE_FACTORIES.get(node_type, _operation_node)(node)
+        if root_id is None and node_type == 'Function':
+            root_id = node['id']
+
+
+    edges_by_source = defaultdict(list)
+    for from_id, to_id in flowgraph['edges']:
+        edges_by_source[from_id].append(node_map[to_id])
 
+    for from_id, to_nodes in edges_by_source.items():
+        from_node = node_map[from_id]
 
-    for edge in flowgraph['edges']:
-        from_node = node_map[edge['from']]
-        to_node = node_map[edge['to']]
-        
         if isinstance(from_node, ConditionNode):
-            if not from_node.connections:
-                from_node.connect_yes(to_node)
-            else:
+            # First outgoing edge is the yes branch, the rest are no branches
+            from_node.connect_yes(to_nodes[0])
+            for to_node in to_nodes[1:]:
                 from_node.connect_no(to_node)
         else:
-            from_node.connect(to_node)
+            for to_node in to_nodes:
+                from_node.connect(to_node)
 
-    root = next(n for n in flowgraph['nodes'] if n['type'] == 'Function')
-    return Flowchart(node_map[root['id']])
\ No newline at end of file
+    return Flowchart(node_map[root_id])
\ No newline at end of file
@@ -1,3 +1,5 @@
+import sys
+
 from ply import lex
 
 # List of reserved words jo use honge
@@ -46,6 +48,9 @@ reserved = {
     'while': 'WHILE'
 }
 
+# Bound once here so t_IDENTIFIER does not look up reserved.get per token
+_reserved_get = reserved.get
+
 # List of token names
 tokens = (
     'IDENTIFIER',
@@ -174,21 +179,25 @@ def t_BLOCK_COMMENT(t):
 
 # Recognizes variable names, keywords, function names, etc.
 # If the identifier matches a keyword, its type is changed accordingly.
+# Names are interned so repeated identifiers share one string object.
 def t_IDENTIFIER(t):
     r'[A-Za-z_][A-Za-z0-9_]*'
-    t.type = reserved.get(t.value, 'IDENTIFIER')
+    t.value = sys.intern(t.value)
+    t.type = _reserved_get(t.value, 'IDENTIFIER')
     return t
 
 # Matches both integer and floating-point numbers, including hexadecimal.
 # Converts the matched number string to int or float accordingly.
+# Hex is checked first so digits like 0xE1 are not mistaken for an exponent.
 def t_NUMBER(t):
     r'((0x|0X)[0-9A-Fa-f]+)|(\d+(\.\d*)?([eE][+-]?\d+)?)'
-    if '.' in t.value or 'e' in t.value.lower():
-        t.value = float(t.value)
-    elif t.value.startswith('0x') or t.value.startswith('0X'):
-        t.value = int(t.value, 16)
+    value = t.value
+    if value[0] == '0' and len(value) > 1 and value[1] in 'xX':
+        t.value = int(value, 16)
+    elif '.' in value or 'e' in value or 'E' in value:
+        t.value = float(value)
     else:
-        t.value = int(t.value)
+        t.value = int(value)
     return t
 
 # Handles any illegal or unrecognized character.
@@ -199,10 +208,16 @@ def t_error(t):
 
 # Creates the lexer using PLY's lex module.
 # This must be called after all token rules are defined.
-lexer = lex.lex()
+# optimize=1 loads the prebuilt tables from lextab.py instead of validating
+# and recompiling every rule on import; delete lextab.py after changing a rule.
+lexer = lex.lex(optimize=1)
 
-# Accepts code as input, sends it to the lexer.
+# Accepts code as input, sends it to a clone of the lexer built above.
+# Cloning reuses the compiled tables, so nothing is rebuilt per call, while
+# keeping this input's position and line count off the shared lexer.
 # Returns the lexer object to extract tokens using next() or a loop.
 def tokenize(data: str):
-    lexer.input(data)
-    return lexer
+    tok_lexer = lexer.clone()
+    tok_lexer.lineno = 1
+    tok_lexer.input(data)
+    return tok_lexer
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ALIGNAS', 'ALIGNOF', 'AND', 'ANDEQUALS', 'ARROW', 'ASM', 'AUTO', 'BITAND', 'BITNOT', 'BITOR', 'BITSHIFTLEFT', 'BITSHIFTRIGHT', 'BITXOR', 'BOOL', 'BREAK', 'CASE', 'CHAR', 'CHARLITERAL', 'COLON', 'COMMA', 'CONDITIONAL', 'CONST', 'CONTINUE', 'DECREMENT', 'DEFAULT', 'DIVIDE', 'DIVIDEEQUALS', 'DO', 'DOT', 'DOUBLE', 'ELSE', 'ENUM', 'EQUALS', 'EXTERN', 'FALSE', 'FLOAT', 'FOR', 'GOTO', 'IDENTIFIER', 'IF', 'INCREMENT', 'INLINE', 'INT', 'ISEQUALS', 'ISGREATERTHAN', 'ISGREATERTHANEQUAL', 'ISLESSTHAN', 'ISLESSTHANEQUAL', 'ISNOTEQUALS', 'LBRACE', 'LEFTSHIFTEQUALS', 'LONG', 'LPAREN', 'LSQUARE', 'MINUS', 'MINUSEQUALS', 'MODULUS', 'MODULUSEQUALS', 'NOT', 'NULLPTR', 'NUMBER', 'OR', 'OREQUALS', 'PLUS', 'PLUSEQUALS', 'PREPROCESSOR', 'RBRACE', 'REGISTER', 'RESTRICT', 'RETURN', 'RIGHTSHIFTEQUALS', 'RPAREN', 'RSQUARE', 'SEMICOLON', 'SHORT', 'SIGNED', 'SIZEOF', 'STATIC', 'STRINGLITERAL', 'STRUCT', 'SWITCH', 'TIMES', 'TIMESEQUALS', 'TRUE', 'TYPEDEF', 'TYPEOF', 'UNION', 'UNSIGNED', 'VOID', 'VOLATILE', 'WHILE', 'XOREQUALS'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_newline>\\n+)|(?P<t_COMMENT>//.*)|(?P<t_BLOCK_COMMENT>/\\*[^*]*\\*+(?:[^/*][^*]*\\*+)*/)|(?P<t_IDENTIFIER>[A-Za-z_][A-Za-z0-9_]*)|(?P<t_NUMBER>((0x|0X)[0-9A-Fa-f]+)|(\\d+(\\.\\d*)?([eE][+-]?\\d+)?))|(?P<t_PREPROCESSOR>\\#\\s*[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_STRINGLITERAL>"([^\\\\"]|\\\\.)*")|(?P<t_CHARLITERAL>\'([^\\\\\']|\\\\.)*\')|(?P<t_INCREMENT>\\+\\+)|(?P<t_OR>\\|\\|)|(?P<t_PLUSEQUALS>\\+=)|(?P<t_TIMESEQUALS>\\*=)|(?P<t_OREQUALS>\\|=)|(?P<t_XOREQUALS>\\^=)|(?P<t_LEFTSHIFTEQUALS><<=)|(?P<t_RIGHTSHIFTEQUALS>>>=)|(?P<t_DECREMENT>--)|(?P<t_MINUSEQUALS>-=)|(?P<t_DIVIDEEQUALS>/=)|(?P<t_MODULUSEQUALS>%=)|(?P<t_ANDEQUALS>&=)|(?P<t_ISLESSTHANEQUAL><=)|(?P<t_ISGREATERTHANEQUAL>>=)|(?P<t_ISEQUALS>==)|(?P<t_ISNOTEQUALS>!=)|(?P<t_BITSHIFTLEFT><<)|(?P<t_BITSHIFTRIGHT>>>)|(?P<t_ARROW>->)|(?P<t_AND>&&)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_BITOR>\\|)|(?P<t_BITXOR>\\^)|(?P<t_CONDITIONAL>\\?)|(?P<t_DOT>\\.)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_LSQUARE>\\[)|(?P<t_RSQUARE>\\])|(?P<t_NOT>!)|(?P<t_EQUALS>=)|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_MODULUS>%)|(?P<t_ISLESSTHAN><)|(?P<t_ISGREATERTHAN>>)|(?P<t_BITAND>&)|(?P<t_BITNOT>~)|(?P<t_SEMICOLON>;)|(?P<t_COLON>:)|(?P<t_COMMA>,)', [None, ('t_newline', 'newline'), ('t_COMMENT', 'COMMENT'), ('t_BLOCK_COMMENT', 'BLOCK_COMMENT'), ('t_IDENTIFIER', 'IDENTIFIER'), ('t_NUMBER', 'NUMBER'), None, None, None, None, None, (None, 'PREPROCESSOR'), (None, 'STRINGLITERAL'), None, (None, 'CHARLITERAL'), None, (None, 'INCREMENT'), (None, 'OR'), (None, 'PLUSEQUALS'), (None, 'TIMESEQUALS'), (None, 'OREQUALS'), (None, 'XOREQUALS'), (None, 'LEFTSHIFTEQUALS'), (None, 'RIGHTSHIFTEQUALS'), (None, 'DECREMENT'), (None, 'MINUSEQUALS'), (None, 'DIVIDEEQUALS'), (None, 'MODULUSEQUALS'), (None, 'ANDEQUALS'), (None, 'ISLESSTHANEQUAL'), (None, 'ISGREATERTHANEQUAL'), (None, 'ISEQUALS'), (None, 'ISNOTEQUALS'), (None, 'BITSHIFTLEFT'), (None, 'BITSHIFTRIGHT'), (None, 'ARROW'), (None, 'AND'), (None, 'PLUS'), (None, 'TIMES'), (None, 'BITOR'), (None, 'BITXOR'), (None, 'CONDITIONAL'), (None, 'DOT'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'LSQUARE'), (None, 'RSQUARE'), (None, 'NOT'), (None, 'EQUALS'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'MODULUS'), (None, 'ISLESSTHAN'), (None, 'ISGREATERTHAN'), (None, 'BITAND'), (None, 'BITNOT'), (None, 'SEMICOLON'), (None, 'COLON'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -1,125 +1,264 @@
-from lexer import lexer
+from lexer import tokenize
 from custom_parser import parser
-from flowchart_mapping import generate_flowchart
+from flowchart_mapping import render_flowchart
+from ply.lex import LexError
+import io
 import pprint
+import sys
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+class _TokenReplay:
+    """Feed an already lexed token list to the parser; PLY only calls token()."""
+    def __init__(self, tokens):
+        self._tokens = iter(tokens)
+
+    def token(self):
+        return next(self._tokens, None)
+
+def _copy_ast(ast):
+    """Copy the lists (and the tuples holding them) in an AST."""
+    # Built bottom-up from an explicit stack, so deep trees don't hit the
+    # recursion limit: a container is revisited once its children's copies
+    # are the last entries of copies, and replaces them with its own copy.
+    copies = []
+    stack = [(ast, False)]
+    while stack:
+        node, children_done = stack.pop()
+        node_class = type(node)
+        if node_class is not tuple and node_class is not list:
+            copies.append(node)
+        elif not children_done:
+            stack.append((node, True))
+            for child in reversed(node):
+                stack.append((child, False))
+        else:
+            start = len(copies) - len(node)
+            children = copies[start:]
+            del copies[start:]
+            copies.append(tuple(children) if node_class is tuple else children)
+    return copies[0]
+
+@lru_cache(maxsize=128)
+def _parse_cached(code):
+    """Lex and parse C code, keeping (messages, tokens, ast) for repeated inputs.
+
+    The lexer and parser print their errors; the text is captured so that a
+    cached result can report it again.
+    """
+    with redirect_stdout(io.StringIO()) as messages:
+        toks = list(tokenize(code))
+        ast = parser.parse(lexer=_TokenReplay(toks))
+    tokens = tuple((tok.type, tok.value) for tok in toks)
+    return messages.getvalue(), tokens, ast
 
 def generate_ast(code):
     """Generate an Abstract Syntax Tree from C code."""
-    lexer.input(code)
-    print("Tokens:")
-    for tok in lexer:
-        print(f"{tok.type}: {tok.value}")
-    
-    lexer.input(code)
-    
     try:
-        ast = parser.parse(code, lexer=lexer)
-        return ast
-    except Exception as e:
+        messages, tokens, ast = _parse_cached(code)
+    except (LexError, SyntaxError) as e:
+        # Syntax errors are reported by p_error and give a None AST; only
+        # failures PLY raises outright end up here
         print(f"Parser error: {e}")
         return None
+    
+    sys.stdout.write(messages)
+    print("Tokens:")
+    for tok_type, tok_value in tokens:
+        print(f"{tok_type}: {tok_value}")
+    # The cached AST holds lists; callers get their own copy to change
+    return _copy_ast(ast)
+
+# Indent strings by depth, shared by every print_ast call and grown on demand
+_INDENTS = [""]
+
+def _indent(depth):
+    while len(_INDENTS) <= depth:
+        _INDENTS.append(_INDENTS[-1] + "  ")
+    return _INDENTS[depth]
 
-def print_ast(ast, indent=0):
+def print_ast(ast, indent=0, out=None):
     """Pretty print the AST with proper indentation."""
+    # Lines are collected on the outermost call and written in one go
+    top = out is None
+    if top:
+        out = []
+    
     if isinstance(ast, tuple):
-        print("  " * indent + ast[0])
+        out.append(_indent(indent) + ast[0])
         for child in ast[1:]:
-            print_ast(child, indent + 1)
+            print_ast(child, indent + 1, out)
     elif isinstance(ast, list):
         for item in ast:
-            print_ast(item, indent)
+            print_ast(item, indent, out)
     else:
-        print("  " * indent + str(ast))
+        out.append(_indent(indent) + str(ast))
+    
+    if top and out:
+        sys.stdout.write("\n".join(out) + "\n")
+
+# Leaf nodes only carry a value and are filled in directly
+_LEAF_TYPES = frozenset(('Number', 'Identifier'))
+
+# Plain values copied from the AST tuple into the node, as (field, index)
+_VALUE_FIELDS = {
+    'Function': (('return_type', 1), ('name', 2)),
+    'DeclareAssign': (('var_type', 1), ('variable', 2)),
+    'BinOp': (('operator', 1),),
+}
+
+# Children each node type links to, as (field, index) in processing order. An
+# index past the end of a shorter tuple (an if without else) is skipped.
+# Types not listed here get a node but their children are not walked.
+_CHILD_FIELDS = {
+    'Function': (('params', 3), ('body', 4)),
+    'DeclareAssign': (('value', 3),),
+    'If': (('condition', 1), ('then', 2)),
+    'IfElse': (('condition', 1), ('then', 2), ('else', 3)),
+    'While': (('condition', 1), ('body', 2)),
+    'BinOp': (('left', 2), ('right', 3)),
+    'Return': (('returns', 1),),
+}
+
+# Control in a for loop runs init -> condition -> body -> update, each clause
+# chained to the one before it; missing clauses are left out of the chain
+_FOR_FIELDS = (('init', 1), ('condition', 2), ('body', 4), ('update', 3))
+
+# Stack markers: the end of a statement list, and the end of a loop's body
+_LIST_END = object()
+_LOOP_END = object()
+
+def _loop_back_edge(node_info):
+    """Return the edge from the end of a loop's body back to its condition."""
+    # A missing for clause is stood in for by the one before it
+    from_id = node_info.get('update')
+    if from_id is None:
+        from_id = node_info['body']
+    to_id = node_info['condition']
+    if to_id is None:
+        to_id = node_info['init']
+        if to_id is None:
+            to_id = node_info['id']
+    return from_id, to_id
 
 def generate_control_flow(ast):
-    """Generate a control flow representation from the AST."""
+    """Generate a control flow representation from the AST.
+
+    Nodes are dicts keyed by field name; edges are (from_id, to_id) tuples.
+    """
     flow = {'nodes': [], 'edges': []}
+    nodes_append = flow['nodes'].append
+    edges_append = flow['edges'].append
     node_id = 0
-    
-    def process_node(node, parent_id=None):
-        nonlocal node_id
-        current_id = node_id
-        node_id += 1
+    # (type, value type, value) -> id of the node already emitted for a
+    # Number/Identifier in the current top-level item, and the edges into them
+    leaf_ids = {}
+    leaf_edges = set()
+    # Statement chain of the top-level list, once it is reached
+    top_level = None
 
-        if not isinstance(node, (tuple, list)):
-            return current_id
-        
-        if isinstance(node, list):
-            # list_id = current_id
-            # flow['nodes'].append({'id': list_id, 'type': 'Program'})
-            # if parent_id is not None:
-            #     flow['edges'].append({'from': parent_id, 'to': list_id})
-            # for item in node:
-            #     process_node(item, list_id)
-            # return list_id
-            prev_id = parent_id
-            for item in node:
-                stmt_id = process_node(item, prev_id)
-                prev_id = stmt_id
-            return prev_id
-        
-        node_type = node[0]
-        node_info = {'id': current_id, 'type': node_type}
-        flow['nodes'].append(node_info)
-        
-        if parent_id is not None:
-            flow['edges'].append({'from': parent_id, 'to': current_id})
-        
-        if node_type == 'Function':
-            node_info['return_type'] = node[1]  # Return type
-            node_info['name'] = node[2]  # Function name
-            node_info['params'] = process_node(node[3], current_id)  # Parameters
-            node_info['body'] = process_node(node[4], current_id)  # Body
-            
-        elif node_type == 'DeclareAssign':
-            node_info['var_type'] = node[1] # Variable type
-            node_info['variable'] = node[2] # Variable name
-            node_info['value'] = process_node(node[3], current_id)
-            
-        elif node_type in 'If':
-            node_info['condition'] = process_node(node[1], current_id)  # Condition
-            node_info['then'] = process_node(node[2], current_id)  # Then branch
-
-        elif node_type == 'IfElse':
-            node_info['condition'] = process_node(node[1], current_id) # Condition
-            node_info['then'] = process_node(node[2], current_id) # Then branch
-            if len(node) > 3:
-                node_info['else'] = process_node(node[3], current_id) # Else branch
-                
-        elif node_type == 'While':
-            cond_id = process_node(node[1], current_id)  # Condition
-            body_id = process_node(node[2], current_id)  # Body
-            node_info['condition'] = cond_id
-            node_info['body'] = body_id
-            flow['edges'].append({'from': body_id, 'to': cond_id})  # Loop back edge
-            
-        elif node_type == 'For':
-            node_info['init'] = process_node(node[1], current_id) if node[1] else None
-            node_info['condition'] = process_node(node[2], current_id) if node[2] else None
-            node_info['update'] = process_node(node[3], body_id) if node[3] else None
-            node_info['body'] = process_node(node[4], cond_id)
-            # Back edge from update to condition
-            if node_info['update'] and node_info['condition']:
-                flow['edges'].append({'from': node_info['update'], 'to': node_info['condition']})
-            
-        elif node_type == 'BinOp':
-            node_info['operator'] = node[1] # Operator
-            node_info['left'] = process_node(node[2], current_id)  # Left
-            node_info['right'] = process_node(node[3], current_id)  # Right
-            
-        elif node_type in ('Number', 'Identifier'):
-            node_info['value'] = node[1]
-
-        elif node_type == 'Return':
-            if len(node) > 1:
-                node_info['returns'] = process_node(node[1], current_id)
-            
-        return current_id
-    
-    if ast:
-        process_node(ast)
+    # Work items are (node, parent_id, owner, field, chain): owner[field] is
+    # set to the node's id once it is registered. Chained items (statements,
+    # for clauses) take their parent from chain[0] and leave their own id
+    # there for the next one. Children are pushed in reverse so they are
+    # registered in order, and ids are handed out in pre-order.
+    stack = [(ast, None, None, None, None)] if ast else []
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node, parent_id, owner, field, chain = pop()
+        node_class = type(node)
+        if node_class is tuple:
+            if chain is not None:
+                parent_id = chain[0]
+                if chain is top_level:
+                    # Functions and globals never share leaf nodes
+                    leaf_ids.clear()
+                    leaf_edges.clear()
+            node_type = node[0]
+            value = None
+            if node_type in _LEAF_TYPES and chain is None:
+                # Repeated operand leaves within an item share one node; only
+                # the edge is new, and only if this parent has none to it yet.
+                # The value's type is part of the key, as 1 == 1.0 == True.
+                # Leaves used as statements or for clauses are steps of the
+                # control flow, so they always get a node of their own.
+                leaf_value = node[1]
+                key = (node_type, type(leaf_value), leaf_value)
+                value = leaf_ids.get(key)
+                if value is not None:
+                    edge = (parent_id, value)
+                    if parent_id is not None and edge not in leaf_edges:
+                        leaf_edges.add(edge)
+                        edges_append(edge)
+                else:
+                    leaf_ids[key] = node_id
+            if value is None:
+                value = node_id
+                node_id += 1
+                node_info = {'id': value, 'type': node_type}
+                nodes_append(node_info)
+                if parent_id is not None:
+                    edge = (parent_id, value)
+                    if node_type in _LEAF_TYPES and chain is None:
+                        leaf_edges.add(edge)
+                    edges_append(edge)
+
+                if node_type in _LEAF_TYPES:
+                    node_info['value'] = node[1]
+                elif node_type == 'For':
+                    push((_LOOP_END, None, node_info, None, None))
+                    clauses = [value]
+                    for clause_field, index in reversed(_FOR_FIELDS):
+                        if node[index]:
+                            push((node[index], None, node_info, clause_field, clauses))
+                        else:
+                            node_info[clause_field] = None
+                else:
+                    for value_field, index in _VALUE_FIELDS.get(node_type, ()):
+                        node_info[value_field] = node[index]
+                    child_fields = _CHILD_FIELDS.get(node_type)
+                    if child_fields is not None:
+                        if node_type == 'While':
+                            push((_LOOP_END, None, node_info, None, None))
+                        size = len(node)
+                        for child_field, index in reversed(child_fields):
+                            if index < size:
+                                push((node[index], value, node_info, child_field, None))
+        elif node_class is list:
+            # The list has no node of its own; once its statements are done
+            # it reports the last one's id, or its parent's if it is empty
+            if chain is not None:
+                parent_id = chain[0]
+            statements = [parent_id]
+            if node is ast:
+                top_level = statements
+            push((_LIST_END, statements, owner, field, chain))
+            for item in reversed(node):
+                push((item, None, None, None, statements))
+            continue
+        elif node is _LIST_END:
+            value = parent_id[0]
+        elif node is _LOOP_END:
+            edges_append(_loop_back_edge(owner))  # Loop back edge
+            continue
+        else:
+            # Scalars (e.g. the None of a bare return) get no node or id of
+            # their own; the value is embedded in the parent as-is
+            value = node
+
+        if owner is not None:
+            owner[field] = value
+        if chain is not None:
+            chain[0] = value
     return flow
 
+def write_flowchart(path, content):
+    """Write rendered flowchart text to path."""
+    with open(path, "w") as f:
+        f.write(content)
+
 # Test cases
 test_cases = [
     # Simple function with return
@@ -175,24 +314,34 @@ test_cases = [
     # """
 ]
 
-# Run all test cases
-for i, test_code in enumerate(test_cases, 1):
-    print(f"\n=== Test Case {i} ===")
-    print("Input Code:")
-    print(test_code.strip())
-    
-    ast = generate_ast(test_code)
-    print("\nAbstract Syntax Tree:")
-    if ast:
-        print_ast(ast)
-    else:
-        print("Failed to generate AST")
-    
-    if ast:
-        flow = generate_control_flow(ast)
-        print("\nControl Flow Graph:")
-        pprint.pprint(flow)
-        flowchart = generate_flowchart(flow)
-        with open(f"flowchart_{i}.html", "w") as f:
-            f.write(flowchart.flowchart())
+# Run all test cases when executed as a script, not on import
+if __name__ == "__main__":
+    # Flowcharts are written in the background while the remaining test cases
+    # are parsed. Rendering stays on this thread: pyflowchart objects change
+    # while they render, so only the finished text goes to the workers.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writes = []
+        for i, test_code in enumerate(test_cases, 1):
+            print(f"\n=== Test Case {i} ===")
+            print("Input Code:")
+            print(test_code.strip())
+        
+            ast = generate_ast(test_code)
+            print("\nAbstract Syntax Tree:")
+            if ast:
+                print_ast(ast)
+            else:
+                print("Failed to generate AST")
+        
+            if ast:
+                flow = generate_control_flow(ast)
+                print("\nControl Flow Graph:")
+                # Wide and compact; pprint.pprint writes to sys.stdout as it
+                # is at call time, so redirecting it still works
+                pprint.pprint(flow, width=120, compact=True)
+                content = render_flowchart(flow)
+                writes.append(executor.submit(write_flowchart, f"flowchart_{i}.html", content))
+        
+        for write in writes:
+            write.result()
     
\ No newline at end of file